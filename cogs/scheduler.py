@@ -9,8 +9,11 @@ import asyncio
 import heapq
 import logging
 import re
+import time as _time
 import warnings
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from math import ceil
 from secrets import token_hex
 from typing import TYPE_CHECKING, NamedTuple, Type, Literal, cast, TypeAlias, Any
@@ -23,7 +26,14 @@ import discord
 from discord.ext import commands
 
 from src.commands import Cog
-from src.env import COLOUR, SCHEDULER_DATABASE_PATH, DEBUG_MODE, DEFAULT_TIMEZONE, TIME_LANG
+from src.env import (
+    COLOUR,
+    SCHEDULER_DATABASE_PATH,
+    SCHEDULER_DATABASE_WAL,
+    DEBUG_MODE,
+    DEFAULT_TIMEZONE,
+    TIME_LANG,
+)
 
 if TYPE_CHECKING:
     from src.bot import Bot
@@ -31,10 +41,98 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-DB_VERSION = 1
+DB_VERSION = 2
 TIME_PARSE_METHOD: Literal["dateparser"] | Literal["dateutil"] = "dateparser"  # options: 'dateutil', 'dateparser'
 MessageableGuildChannel: TypeAlias = discord.TextChannel | discord.VoiceChannel | discord.Thread
 
+# Import the time parser once at load, rather than on each schedule
+if TIME_PARSE_METHOD == "dateutil":
+    from dateutil import parser as du_parser
+else:
+    from dateparser.date import DateDataParser
+
+_MENTION_PATTERN = r"@(everyone|here|[!&]?[0-9]{17,20})"
+_MENTION_RE: re.Pattern[str]
+try:
+    # google-re2 scans in linear time regardless of input, use it for mention checks when installed
+    import re2  # type: ignore[reportMissingImports]
+except ImportError:  # not installed, or a broken native build
+    _MENTION_RE = re.compile(_MENTION_PATTERN, re.ASCII)  # the pattern only matches ASCII
+else:
+    _MENTION_RE = re2.compile(_MENTION_PATTERN)  # type: ignore[reportUnknownMemberType]
+    del re2  # remove module variable
+
+# Shared by every sent message, discord.py merges these into a new object instead of modifying them
+_MENTIONS_ALL = discord.AllowedMentions.all()
+_MENTIONS_NONE = discord.AllowedMentions.none()
+
+_TIME_LANGUAGES = tuple(TIME_LANG)
+
+# Repeat limits in minutes, 12 seconds minimum for debug mode, 60 min for production
+_MIN_REPEAT = 0.2 if DEBUG_MODE else 60
+_MAX_REPEAT = 60 * 24 * 365
+_MIN_REPEAT_MESSAGE = (
+    "Repeat cannot be less than 12 seconds (debug mode is active)."
+    if DEBUG_MODE
+    else "Repeat cannot be less than one hour."
+)
+
+# Frequently executed statements, kept as constants so the statement text is identical for SQLite's statement cache
+_SQL_INSERT = r"""
+    INSERT INTO Scheduler (message, guild_id, channel_id,
+                           author_id, next_event_time, repeat, mention)
+        VALUES ($message, $guild_id, $channel_id, $author_id,
+                $next_event_time, $repeat, $mention)
+"""
+_SQL_SELECT_EVENT = r"""
+    SELECT *
+        FROM Scheduler
+        WHERE id=$id
+"""
+_SQL_CANCEL = r"""
+    UPDATE Scheduler
+        SET canceled=1
+        WHERE id=$id
+"""
+_SQL_RESCHEDULE = r"""
+    UPDATE Scheduler
+        SET next_event_time=$next_event_time
+        WHERE id=$id
+"""
+
+# Time formats shown to the user when the time is invalid
+if TIME_PARSE_METHOD == "dateutil":
+    _ACCEPTABLE_TIME_FORMATS = (
+        "- 1/30/2023 3:20am",
+        "- Jan 30 2023 3:20",
+        "- 2023-Jan-30 3h20m",
+        "- January 30th, 2023 at 03:20:00",
+    )
+else:
+    _ACCEPTABLE_TIME_FORMATS = (
+        "- Just date: `2/24/2023` (Month/Day/Year), `December 12`, `nov 26 2023`",
+        "- Just time: `1:12am`, `midnight`, `13:42`, `7pm`",
+        "- Date and time: `02/24/23 19:31:03`",
+        "- Other date formats: `March 30 2023 4:10pm`",
+        "- Simple time: `tomorrow`, `next week`, `thursday at noon`",
+        "- Slightly complicated relative time: `in 1 day, 2 hours and 10 minutes`",
+        "- ISO 8601 format: `2023-08-11T01:59:41.981897`",
+    )
+_VALID_TIME_FORMATS_FIELD = "\n".join(_ACCEPTABLE_TIME_FORMATS) + "\n- And More..."
+
+# Exact time formats tried with strptime before falling back to the (much slower) flexible parser
+_FAST_TIME_FORMATS = (
+    "%m/%d/%y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%y %H:%M",
+    "%m/%d/%Y %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M",
+)
+
 
 class RawScheduleModalValues(NamedTuple):
     """
@@ -73,10 +171,12 @@ class SanitizedScheduleEvent(NamedTuple):
     channel: MessageableGuildChannel
     message: str
     time: arrow.Arrow
+    timestamp: int  # the time as an integer Unix timestamp
     repeat: float | None
 
 
-class ScheduleEvent(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class ScheduleEvent:
     """
     Represents a single scheduled message event.
     """
@@ -85,6 +185,7 @@ class ScheduleEvent(NamedTuple):
     channel: MessageableGuildChannel
     message: str
     time: arrow.Arrow
+    timestamp: int  # the time as an integer Unix timestamp
     repeat: float | None
     mention: bool
 
@@ -97,7 +198,7 @@ class ScheduleEvent(NamedTuple):
         :param mention: Whether mention is allowed.
         :return: The converted ScheduleEvent.
         """
-        return cls(event.author, event.channel, event.message, event.time, event.repeat, mention)
+        return cls(event.author, event.channel, event.message, event.time, event.timestamp, event.repeat, mention)
 
     @classmethod
     def from_saved(
@@ -116,12 +217,14 @@ class ScheduleEvent(NamedTuple):
             channel,
             event.message,
             arrow.get(event.next_event_time),
+            event.next_event_time,
             float(event.repeat) if event.repeat is not None else None,
             event.mention,
         )
 
 
-class SavedScheduleEvent(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class SavedScheduleEvent:
     """
     Represents a single scheduled message event in DB format.
     """
@@ -154,12 +257,6 @@ class SavedScheduleEvent(NamedTuple):
         """
         return cls(*row)
 
-    def __lt__(self, other: SavedScheduleEvent) -> bool:  # type: ignore[reportIncompatibleMethodOverride]
-        """
-        Use next_event_time as the comp.
-        """
-        return self.next_event_time < other.next_event_time
-
 
 @dataclass(slots=True)
 class StrippedSavedScheduleEvent:
@@ -170,6 +267,7 @@ class StrippedSavedScheduleEvent:
     id: int
     next_event_time: int
     repeat: float | int | None
+    canceled: bool = False  # deleted events stay in the heap until popped or compacted
 
     @classmethod
     def from_row(cls, row: aiosqlite.Row) -> StrippedSavedScheduleEvent:
@@ -183,20 +281,35 @@ class StrippedSavedScheduleEvent:
 
     def do_repeat(self, current_timestamp: int) -> StrippedSavedScheduleEvent:
         """
-        Do an iteration of repeat.
+        Do an iteration of repeat. The event is updated in place rather than rebuilt.
 
-        :return: New StrippedSavedScheduleEvent with updated next_event_time.
+        :param current_timestamp: The timestamp to repeat from.
+        :return: This StrippedSavedScheduleEvent with updated next_event_time.
         """
         if self.repeat is None:
             raise ValueError("repeat cannot be None to do_repeat().")
         self.next_event_time = int(current_timestamp + self.repeat * 60)
         return self
 
-    def __lt__(self, other: StrippedSavedScheduleEvent) -> bool:  # type: ignore[reportIncompatibleMethodOverride]
+    def heap_entry(self) -> ScheduleHeapEntry:
         """
-        Use next_event_time as the comp.
+        Create the schedule heap entry of this event.
+
+        Entries are ordered by (next_event_time, id) using plain tuple comparison.
+
+        :return: The heap entry.
         """
-        return self.next_event_time < other.next_event_time
+        return self.next_event_time, self.id, self
+
+
+# (next_event_time, id, event), the event ID is the tie-breaker. IDs are unique and an event is in the heap
+# at most once, so two entries never tie and the events themselves are never compared.
+ScheduleHeapEntry: TypeAlias = tuple[int, int, StrippedSavedScheduleEvent]
+
+# (guild_id, channel_id, author_id) -> (channel, author, author permissions, bot permissions)
+SendTargetCache: TypeAlias = dict[
+    tuple[int, int, int], tuple[discord.abc.Messageable, discord.Member, discord.Permissions, discord.Permissions]
+]
 
 
 class ScheduleError(ValueError):
@@ -333,16 +446,63 @@ def _parse_repeat(raw_repeat: str | None) -> float | None:
             # verify repeat is < year and > one hour
             if repeat <= 0:
                 repeat = None
-            elif repeat > 60 * 24 * 365:
-                raise InvalidRepeat("Repeat cannot be longer than a year.")
-            elif repeat < (0.2 if DEBUG_MODE else 60):  # 12 seconds for debug mode, 60 min for production
-                if DEBUG_MODE:
-                    raise InvalidRepeat("Repeat cannot be less than 12 seconds (debug mode is active).")
-                else:
-                    raise InvalidRepeat("Repeat cannot be less than one hour.")
+            elif not _MIN_REPEAT <= repeat <= _MAX_REPEAT:
+                if repeat > _MAX_REPEAT:
+                    raise InvalidRepeat("Repeat cannot be longer than a year.")
+                raise InvalidRepeat(_MIN_REPEAT_MESSAGE)
     return repeat
 
 
+def _compacted_heap(heap: list[ScheduleHeapEntry]) -> list[ScheduleHeapEntry]:
+    """
+    Builds a new schedule heap without the canceled events.
+
+    :param heap: The schedule heap to compact, it isn't modified.
+    :return: The compacted heap.
+    """
+    compacted = [entry for entry in heap if not entry[2].canceled]
+    heapq.heapify(compacted)
+    return compacted
+
+
+def _parse_fast_time(raw_time: str) -> datetime | None:
+    """
+    Parse common exact time formats without going through dateparser.
+
+    :param raw_time: The raw time field value.
+    :return: The parsed naive datetime, or None if no exact format matches.
+    """
+    raw_time = raw_time.strip()
+    for fmt in _FAST_TIME_FORMATS:
+        try:
+            return datetime.strptime(raw_time, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=64)
+def _get_date_data_parser(timezone: str | None, languages: tuple[str, ...]) -> DateDataParser:
+    """
+    Get a cached dateparser DateDataParser for the timezone and languages.
+
+    Constructing the parser normalizes its settings and loads the language data, which
+    dominates the cost of parsing short time strings, so parsers are reused between calls.
+
+    :param timezone: The timezone of the parsed time.
+    :param languages: The languages of the parsed time.
+    :return: The DateDataParser for the timezone and languages.
+    """
+    return DateDataParser(
+        languages=list(languages),
+        settings={
+            "TIMEZONE": timezone,
+            "RETURN_AS_TIMEZONE_AWARE": True,
+            "DEFAULT_LANGUAGES": list(languages),
+        },  # type: ignore[reportGeneralTypeIssues]
+    )
+
+
 def get_schedule_modal(defaults: RawScheduleModalValues | None = None) -> Type[ScheduleModal]:
     """
     This is a class factory to create ScheduleModal with defaults.
@@ -354,6 +514,22 @@ def get_schedule_modal(defaults: RawScheduleModalValues | None = None) -> Type[S
     time_default = cast(str | None, defaults and defaults.time)
     timezone_default = cast(str, defaults and defaults.timezone or DEFAULT_TIMEZONE)
     repeat_default = cast(str, defaults and defaults.repeat or "0")
+    return _build_schedule_modal(message_default, time_default, timezone_default, repeat_default)
+
+
+@lru_cache(maxsize=256)
+def _build_schedule_modal(
+    message_default: str | None, time_default: str | None, timezone_default: str, repeat_default: str
+) -> Type[ScheduleModal]:
+    """
+    Build the ScheduleModal class with defaults, cached by the defaults.
+
+    :param message_default: The default of the message field.
+    :param time_default: The default of the time field.
+    :param timezone_default: The default of the timezone field.
+    :param repeat_default: The default of the repeat field.
+    :return: A class ScheduleModal with defaults.
+    """
 
     # noinspection PyShadowingNames
     class ScheduleModal(discord.ui.Modal, title="Schedule Creator"):
@@ -410,8 +586,6 @@ def get_schedule_modal(defaults: RawScheduleModalValues | None = None) -> Type[S
                 raise ValueError("interaction.user must be a Member (cannot be ran from DM).")
 
             if TIME_PARSE_METHOD == "dateutil":
-                from dateutil import parser as du_parser
-
                 try:
                     # parse the time
                     with warnings.catch_warnings():  # will raise exception is an unknown timezone is detected
@@ -434,62 +608,55 @@ def get_schedule_modal(defaults: RawScheduleModalValues | None = None) -> Type[S
                         raise BadTimezone(self.timezone.value) from e
                 else:
                     time = arrow.get(naive_time)  # will use either tz from naive time or UTC
-                del du_parser  # remove local variable
 
             else:  # dateparser method
-                import dateparser as dp_parser
+                time = None
+                # An empty timezone is left for dateparser, which rejects it. So is "local", dateparser and
+                # arrow resolve it to different zones.
+                if self.timezone.value and self.timezone.value.lower() != "local":
+                    naive_time = _parse_fast_time(self.time.value)
+                else:
+                    naive_time = None
+                if naive_time is not None:
+                    try:
+                        time = arrow.get(naive_time, self.timezone.value)
+                    except (arrow.ParserError, ValueError) as e:  # let dateparser handle or reject the timezone
+                        logger.debug("Failed to parse timezone in fast path.", exc_info=e)
 
-                try:
-                    naive_time = dp_parser.parse(
-                        self.time.value,
-                        languages=TIME_LANG,
-                        settings={
-                            "TIMEZONE": self.timezone.value,
-                            "RETURN_AS_TIMEZONE_AWARE": True,
-                            "DEFAULT_LANGUAGES": TIME_LANG,
-                        },  # type: ignore[reportGeneralTypeIssues]
-                    )
-                except Exception as e:
-                    if e.__class__.__name__ == "UnknownTimeZoneError":  # invalid timezone
-                        raise BadTimezone(self.timezone.value) from e
-                    raise  # re-raise
+                if time is None:
+                    try:
+                        naive_time = (
+                            _get_date_data_parser(self.timezone.value, _TIME_LANGUAGES)
+                            .get_date_data(self.time.value)
+                            .date_obj
+                        )
+                    except Exception as e:
+                        if e.__class__.__name__ == "UnknownTimeZoneError":  # invalid timezone
+                            raise BadTimezone(self.timezone.value) from e
+                        raise  # re-raise
 
-                if naive_time is None:
-                    raise BadTimeString(self.time.value)
-                time = arrow.get(naive_time)
-                del dp_parser  # remove local variable
+                    if naive_time is None:
+                        raise BadTimeString(self.time.value)
+                    time = arrow.get(naive_time)
 
             # check time is in the future
-            now = arrow.utcnow()
-            if time <= now:
+            timestamp = time.timestamp()
+            now = _time.time()  # compare as timestamps to avoid building an Arrow for now
+            if timestamp <= now:
                 logger.debug("Time is in the past. Time: %s, now: %s", time, now)
                 raise TimeInPast(time)
 
             repeat = _parse_repeat(self.repeat.value)
-            return SanitizedScheduleEvent(interaction.user, self.channel, self.message.value, time, repeat)
+            return SanitizedScheduleEvent(
+                interaction.user, self.channel, self.message.value, time, int(timestamp), repeat
+            )
 
         @property
         def acceptable_formats(self) -> list[str]:
             """
             :return: A list of acceptable time formats.
             """
-            if TIME_PARSE_METHOD == "dateutil":
-                return [
-                    "- 1/30/2023 3:20am",
-                    "- Jan 30 2023 3:20",
-                    "- 2023-Jan-30 3h20m",
-                    "- January 30th, 2023 at 03:20:00",
-                ]
-            else:
-                return [
-                    "- Just date: `2/24/2023` (Month/Day/Year), `December 12`, `nov 26 2023`",
-                    "- Just time: `1:12am`, `midnight`, `13:42`, `7pm`",
-                    "- Date and time: `02/24/23 19:31:03`",
-                    "- Other date formats: `March 30 2023 4:10pm`",
-                    "- Simple time: `tomorrow`, `next week`, `thursday at noon`",
-                    "- Slightly complicated relative time: `in 1 day, 2 hours and 10 minutes`",
-                    "- ISO 8601 format: `2023-08-11T01:59:41.981897`",
-                ]
+            return list(_ACCEPTABLE_TIME_FORMATS)
 
         async def on_submit(self, interaction: discord.Interaction) -> None:
             """
@@ -520,9 +687,7 @@ def get_schedule_modal(defaults: RawScheduleModalValues | None = None) -> Type[S
                     f"Double check the time is valid or try one of the formats below.",
                     colour=COLOUR,
                 )
-                embed.add_field(
-                    name="Valid time formats:", value="\n".join(self.acceptable_formats) + "\n- And More..."
-                )
+                embed.add_field(name="Valid time formats:", value=_VALID_TIME_FORMATS_FIELD)
             except InvalidRepeat as e:  # repeat is invalid
                 logger.debug("Bad repeat %s.", self.repeat, exc_info=e)
                 embed = discord.Embed(description=e.reason, colour=COLOUR)
@@ -531,12 +696,10 @@ def get_schedule_modal(defaults: RawScheduleModalValues | None = None) -> Type[S
                     description=f"I cannot understand the time **{discord.utils.escape_markdown(e.time)}**.",
                     colour=COLOUR,
                 )
-                embed.add_field(
-                    name="Valid time formats:", value="\n".join(self.acceptable_formats) + "\n- And More..."
-                )
+                embed.add_field(name="Valid time formats:", value=_VALID_TIME_FORMATS_FIELD)
             else:
                 # Check if the message contains a mention and both author
-                mentions = re.search(r"@(everyone|here|[!&]?[0-9]{17,20})", event.message)
+                mentions = _MENTION_RE.search(event.message)
 
                 if mentions is not None:
                     logger.debug("Event has mention.")
@@ -669,6 +832,7 @@ def get_schedule_edit_modal(defaults: RawScheduleModalValues | None = None) -> T
                 self.channel,
                 self.message.value,
                 arrow.get(self.original_event.next_event_time),
+                self.original_event.next_event_time,
                 repeat,
             )
 
@@ -683,7 +847,7 @@ def get_schedule_edit_modal(defaults: RawScheduleModalValues | None = None) -> T
                 embed = discord.Embed(description=e.reason, colour=COLOUR)
             else:
                 # Check if the message contains a mention and both author
-                mentions = re.search(r"@(everyone|here|[!&]?[0-9]{17,20})", event.message)
+                mentions = _MENTION_RE.search(event.message)
 
                 if mentions is not None:
                     logger.debug("Event has mention.")
@@ -1128,52 +1292,150 @@ class Scheduler(Cog):
 
     PER_CHANNEL_LIMIT = 50
     PER_GUILD_LIMIT = 250
+    INSERT_BATCH_LIMIT = 100
+    INSERT_BATCH_DELAY = 0.05  # how long the insert writer waits for more inserts before writing a batch (seconds)
+    MAX_SLEEP = 60  # the scheduler loop wakes up at least this often (seconds), in case the system clock changes
+    MIN_COMPACT_HEAP_SIZE = 100  # the heap is never compacted below this size
+    MIN_CANCELED_HEAP_FRACTION = 0.5  # compact the heap once this fraction of it is canceled events
+    THREADED_COMPACT_HEAP_SIZE = 5000  # heaps larger than this are compacted in a thread
 
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
         self.db: aiosqlite.Connection = cast(aiosqlite.Connection, None)
-        self.schedule_heap: list[StrippedSavedScheduleEvent] = []
-        self.heap_lock = asyncio.Lock()
+        # No lock guards the heap: everything runs on the one event loop and every heap operation is
+        # synchronous, so no other coroutine can run in the middle of one. Never await between a peek and a pop.
+        self.schedule_heap: list[ScheduleHeapEntry] = []
+        self._insert_queue: asyncio.Queue[
+            tuple[ScheduleEvent, asyncio.Future[SavedScheduleEvent]]
+        ] = asyncio.Queue()
+        self._insert_task: asyncio.Task[None] | None = None
+        self._scheduler_task: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()  # set to wake up the scheduler loop before its deadline
+        self._heap_events: dict[int, StrippedSavedScheduleEvent] = {}  # events in the heap that aren't canceled
+        self._canceled_count = 0  # canceled events still in the heap
+        # Every coroutine shares the connection's one open transaction. Hold this from the first write
+        # to the commit or rollback, so a rollback only ever undoes its own writes.
+        self._write_lock = asyncio.Lock()
+        self._compacting = False
 
     async def cog_load(self) -> None:
         """
         This is called when cog is loaded.
         """
         logger.info("Loading scheduler cog.")
+        if TIME_PARSE_METHOD == "dateparser":
+            # Build the parser for the default timezone now, so the first schedule doesn't pay for it
+            _get_date_data_parser(DEFAULT_TIMEZONE, _TIME_LANGUAGES)
+
         # Setup database
         await self.init_db()
 
         logger.debug("Populating schedules.")
         # Populate schedules from database
-        schedules: list[StrippedSavedScheduleEvent] = []
-        async with self.db.execute(
+        # Fetch everything in one round-trip to the DB thread
+        rows = await self.db.execute_fetchall(
             r"""
             SELECT id, next_event_time, repeat
                 FROM Scheduler
                 WHERE canceled=0
-                ORDER BY next_event_time
+                ORDER BY next_event_time, id
         """
-        ) as cur:
-            async for row in cur:
-                schedules += [StrippedSavedScheduleEvent.from_row(row)]
+        )
+        schedules = [StrippedSavedScheduleEvent.from_row(row) for row in rows]
 
         logger.info("Populated %d schedules.", len(schedules))
 
-        async with self.heap_lock:
-            self.schedule_heap = schedules
-            heapq.heapify(self.schedule_heap)
+        # The query is ordered by (next_event_time, id) like the heap entries,
+        # a sorted list is already a valid heap.
+        # The scheduler loop hasn't started yet, so the heap can be set directly.
+        self.schedule_heap = [schedule.heap_entry() for schedule in schedules]
+        self._heap_events = {schedule.id: schedule for schedule in schedules}
 
-        # Start the scheduler loop
-        asyncio.create_task(self.scheduler_event_loop())
+        # Start the insert writer and the scheduler loop, keep references so they don't get garbage collected
+        self._insert_task = asyncio.create_task(self._insert_writer(), name="scheduler_insert_writer")
+        self._insert_task.add_done_callback(self._log_task_exception)
+        self._scheduler_task = asyncio.create_task(self.scheduler_event_loop(), name="scheduler_event_loop")
+        self._scheduler_task.add_done_callback(self._log_task_exception)
 
     async def cog_unload(self) -> None:
         """
         This is called when cog is unloaded.
         """
+        # Stop the scheduler loop and the insert writer. Wait for them before closing the database, the
+        # scheduler loop still writes the changes of the batch it was firing.
+        tasks = [task for task in (self._scheduler_task, self._insert_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Fail any inserts that didn't get written
+        while not self._insert_queue.empty():
+            _, future = self._insert_queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Scheduler cog was unloaded."))
+
         # Close SQLite database
         logger.debug("Closing DB connection.")
         await self.db.close()
 
+    async def _cancel_heap_event(self, event_id: int) -> None:
+        """
+        Flags an event in the schedule heap as canceled, it gets skipped when popped.
+        The heap is compacted once most of it is canceled events.
+
+        :param event_id: The ID of the canceled event.
+        """
+        event = self._heap_events.pop(event_id, None)
+        if event is None:
+            return  # not in the heap, or being sent right now; the database check catches it
+        event.canceled = True
+        self._canceled_count += 1
+
+        heap_size = len(self.schedule_heap)
+        if (
+            not self._compacting
+            and heap_size > self.MIN_COMPACT_HEAP_SIZE
+            and self._canceled_count > heap_size * self.MIN_CANCELED_HEAP_FRACTION
+        ):
+            await self._compact_heap()
+
+    async def _compact_heap(self) -> None:
+        """
+        Removes all canceled events from the schedule heap.
+        Large heaps are compacted in a thread so the event loop isn't stalled.
+        """
+        heap = self.schedule_heap
+        logger.debug("Compacting the schedule heap, removing %d canceled events.", self._canceled_count)
+        if len(heap) <= self.THREADED_COMPACT_HEAP_SIZE:
+            self.schedule_heap = _compacted_heap(heap)
+            self._canceled_count -= len(heap) - len(self.schedule_heap)
+            return
+
+        # The thread owns the old heap, the scheduler loop works on an empty one in the meantime.
+        # Events saved during the compaction are merged back afterwards.
+        self._compacting = True
+        self.schedule_heap = []
+        compacted = heap
+        try:
+            compacted = await asyncio.to_thread(_compacted_heap, heap)
+            self._canceled_count -= len(heap) - len(compacted)
+        finally:
+            for entry in self.schedule_heap:
+                heapq.heappush(compacted, entry)
+            self.schedule_heap = compacted
+            self._compacting = False
+            self._wakeup.set()  # events in the old heap may have become due
+
+    @staticmethod
+    def _log_task_exception(task: asyncio.Task[None]) -> None:
+        """
+        Done callback for background tasks, logs the exception if the task died.
+
+        :param task: The finished task.
+        """
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error("Background task %s stopped unexpectedly.", task.get_name(), exc_info=exc)
+
     async def _update_to_version_0(self) -> None:
         """
         Update DB to version 0.
@@ -1183,8 +1445,10 @@ class Scheduler(Cog):
           - Add 3 indices to Scheduler
         """
         logger.info("[orange]Updating DB version to 0[/orange]", extra={"markup": True})
-        async with self.db.execute(
+        await self.db.executescript(
             r"""
+                BEGIN;
+
                 CREATE TABLE Scheduler (
                     id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
                     message VARCHAR(1000) NOT NULL,
@@ -1194,31 +1458,15 @@ class Scheduler(Cog):
                     next_event_time INTEGER,
                     repeat DOUBLE,
                     canceled BOOLEAN NOT NULL DEFAULT 0 CHECK (canceled IN (0, 1))
-                )
-            """
-        ):
-            pass
+                );
 
-        async with self.db.execute(
-            r"""
-                CREATE INDEX IF NOT EXISTS idx_scheduler_time ON Scheduler (next_event_time)
-            """
-        ):
-            pass
+                CREATE INDEX IF NOT EXISTS idx_scheduler_time ON Scheduler (next_event_time);
+                CREATE INDEX IF NOT EXISTS idx_scheduler_guild_author ON Scheduler (guild_id, author_id);
+                CREATE INDEX IF NOT EXISTS idx_scheduler_canceled ON Scheduler (canceled);
 
-        async with self.db.execute(
-            r"""
-                CREATE INDEX IF NOT EXISTS idx_scheduler_guild_author ON Scheduler (guild_id, author_id)
+                COMMIT;
             """
-        ):
-            pass
-
-        async with self.db.execute(
-            r"""
-                CREATE INDEX IF NOT EXISTS idx_scheduler_canceled ON Scheduler (canceled)
-            """
-        ):
-            pass
+        )
 
     async def _update_to_version_1(self) -> None:
         """
@@ -1229,28 +1477,78 @@ class Scheduler(Cog):
           - Add mention column to Scheduler
         """
         logger.info("[orange]Updating DB version to 1[/orange]", extra={"markup": True})
-        async with self.db.execute(
+        await self.db.executescript(
             r"""
-            INSERT INTO Meta(name, value)
-            VALUES ('version', 1)
+                BEGIN;
+
+                INSERT INTO Meta(name, value)
+                VALUES ('version', 1);
+
+                ALTER TABLE Scheduler
+                ADD COLUMN mention BOOLEAN NOT NULL DEFAULT 0 CHECK (canceled IN (0, 1));
+
+                COMMIT;
+            """
+        )
+
+    async def _update_to_version_2(self) -> None:
         """
-        ):
-            pass
+        Update DB to version 2.
 
-        async with self.db.execute(
-            r"""
-            ALTER TABLE Scheduler
-            ADD COLUMN mention BOOLEAN NOT NULL DEFAULT 0 CHECK (canceled IN (0, 1))
+        Changes:
+          - Replace the next_event_time and canceled indices with a (canceled, next_event_time) index
+          - Set version=2 in Meta table
         """
-        ):
-            pass
+        logger.info("[orange]Updating DB version to 2[/orange]", extra={"markup": True})
+        await self.db.executescript(
+            r"""
+                BEGIN;
+
+                CREATE INDEX IF NOT EXISTS idx_scheduler_canceled_time ON Scheduler (canceled, next_event_time);
+                DROP INDEX IF EXISTS idx_scheduler_time;
+                DROP INDEX IF EXISTS idx_scheduler_canceled;
+
+                UPDATE Meta
+                    SET value=2
+                    WHERE name='version';
+
+                COMMIT;
+            """
+        )
 
     async def init_db(self) -> None:
         """
         Initiates the SQLite database.
         """
         logger.debug("Initiating DB connection.")
-        self.db = await aiosqlite.connect(SCHEDULER_DATABASE_PATH)
+        self.db = await aiosqlite.connect(SCHEDULER_DATABASE_PATH, cached_statements=256)
+
+        if SCHEDULER_DATABASE_WAL:
+            # WAL with synchronous=NORMAL only syncs on checkpoints instead of on every commit
+            await self.db.executescript(
+                r"""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+            """
+            )
+        else:
+            # The journal mode is saved in the database file, switch back in case WAL was enabled before.
+            # Leaving WAL needs exclusive access, so this fails while another process has the database open.
+            try:
+                await self.db.executescript(
+                    r"""
+                    PRAGMA journal_mode=DELETE;
+                """
+                )
+            except aiosqlite.OperationalError as e:
+                logger.warning("Failed to turn off WAL mode for the database.", exc_info=e)
+        await self.db.executescript(
+            r"""
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA mmap_size=268435456;
+        """
+        )
 
         # Checks if the meta table exists
         async with self.db.execute(
@@ -1267,15 +1565,14 @@ class Scheduler(Cog):
         # or DB version is 0
         if not meta_exists:
             # Create the meta table
-            async with self.db.execute(
+            await self.db.execute(
                 r"""
                 CREATE TABLE Meta (
                     name VARCHAR(10) PRIMARY KEY NOT NULL,
                     value INTEGER NOT NULL
                 )
             """
-            ):
-                pass
+            )
 
             # Checks if the scheduler table exists
             async with self.db.execute(
@@ -1293,46 +1590,123 @@ class Scheduler(Cog):
                 await self._update_to_version_0()
             await self._update_to_version_1()
 
-        await self.db.commit()  # commit the changes
+        # Get the current DB version
+        async with self.db.execute(
+            r"""
+            SELECT value
+                FROM Meta
+                WHERE name='version'
+        """
+        ) as cur:
+            row = await cur.fetchone()
+        if row is None:
+            raise ValueError("Something went wrong with the DB, version should not be None.")
+        db_version: int = row[0]
+        logger.debug("DB version is %d.", db_version)
 
-    logger.info("Using SQLite version %s.", aiosqlite.sqlite_version)
-    # Older versions don't support RETURNING in SQLite
-    if version.parse(aiosqlite.sqlite_version) >= version.parse("3.35.0"):
+        if db_version < 2:
+            await self._update_to_version_2()
 
-        async def _insert_schedule(self, event: ScheduleEvent) -> SavedScheduleEvent:
-            """
-            Insert a schedule event into DB SQLite version >= 3.35.0.
+        await self.db.commit()  # commit the changes
 
-            When modifying this method, be sure to update the < 3.35.0 sister method as well.
+    async def _insert_schedule(self, event: ScheduleEvent) -> SavedScheduleEvent:
+        """
+        Insert a schedule event into DB.
+
+        The insert is queued and written by the insert writer task, together with any
+        other inserts queued at the same time.
+
+        :param event: The ScheduleEvent of the event.
+        :return: The saved SavedScheduleEvent.
+        """
+        future: asyncio.Future[SavedScheduleEvent] = asyncio.get_running_loop().create_future()
+        self._insert_queue.put_nowait((event, future))
+        return await future
+
+    async def _insert_schedules(self, events: list[ScheduleEvent]) -> list[SavedScheduleEvent]:
+        """
+        Insert schedule events into DB in a single transaction.
+
+        :param events: The ScheduleEvents to insert.
+        :return: The saved SavedScheduleEvents, in the same order as events.
+        """
+        logger.debug("Inserting %d events into DB.", len(events))
+        params = [
+            {
+                "message": event.message,
+                "guild_id": event.channel.guild.id,
+                "channel_id": event.channel.id,
+                "author_id": event.author.id,
+                "next_event_time": event.timestamp,
+                "repeat": event.repeat,
+                "mention": int(event.mention),
+            }
+            for event in events
+        ]
+        await self.db.executemany(_SQL_INSERT, params)
+        rows = await self.db.execute_fetchall("SELECT last_insert_rowid()")
+        await self.db.commit()
+
+        # IDs are consecutive since the rows are inserted together within one transaction,
+        # every other column is already known so the saved events are built without reading them back
+        first_id: int = list(rows)[0][0] - len(events) + 1
+        return [
+            SavedScheduleEvent(
+                first_id + i,
+                param["message"],
+                param["guild_id"],
+                param["channel_id"],
+                param["author_id"],
+                param["next_event_time"],
+                param["repeat"],
+                False,
+                event.mention,
+            )
+            for i, (event, param) in enumerate(zip(events, params))
+        ]
 
-            :param event: The ScheduleEvent of the event.
-            :return: The saved SavedScheduleEvent.
-            """
-            async with self.db.execute(
-                r"""
-                    INSERT INTO Scheduler (message, guild_id, channel_id,
-                                           author_id, next_event_time, repeat, mention)
-                        VALUES ($message, $guild_id, $channel_id, $author_id,
-                                $next_event_time, $repeat, $mention)
-                        RETURNING *
-                """,
-                {
-                    "message": event.message,
-                    "guild_id": event.channel.guild.id,
-                    "channel_id": event.channel.id,
-                    "author_id": event.author.id,
-                    "next_event_time": int(event.time.timestamp()),
-                    "repeat": event.repeat,
-                    "mention": int(event.mention),
-                },
-            ) as cur:
-                row = await cur.fetchone()
-                if row is None:
-                    raise ValueError("Something went wrong with SQLite, row should not be None.")
-                event_db = SavedScheduleEvent.from_row(row)
+    async def _insert_writer(self) -> None:
+        """
+        Writes queued inserts into DB, batching all inserts queued within INSERT_BATCH_DELAY of the first one.
+        """
+        while True:
+            batch = [await self._insert_queue.get()]
+            try:
+                # Give the rest of a burst a moment to queue up, so they share one commit
+                await asyncio.sleep(self.INSERT_BATCH_DELAY)
+                while len(batch) < self.INSERT_BATCH_LIMIT and not self._insert_queue.empty():
+                    batch += [self._insert_queue.get_nowait()]
 
-            await self.db.commit()
-            return event_db
+                try:
+                    async with self._write_lock:
+                        try:
+                            events_db = await self._insert_schedules([event for event, _ in batch])
+                        except Exception:
+                            # Don't leave the failed transaction open, the next commit would save part of the batch
+                            try:
+                                await self.db.rollback()
+                            except Exception as rollback_error:
+                                logger.error(
+                                    "Failed to roll back the failed insert batch.", exc_info=rollback_error
+                                )
+                            raise
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for (_, future), event_db in zip(batch, events_db):
+                        if not future.done():
+                            future.set_result(event_db)
+            finally:
+                # Only left unresolved when cancelled by cog_unload, don't leave the callers waiting forever
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("Scheduler cog was unloaded."))
+
+    logger.info("Using SQLite version %s.", aiosqlite.sqlite_version)
+    # Older versions don't support RETURNING in SQLite
+    if version.parse(aiosqlite.sqlite_version) >= version.parse("3.35.0"):
 
         async def _edit_schedule(
             self, event: ScheduleEvent, original_event: SavedScheduleEvent
@@ -1346,32 +1720,32 @@ class Scheduler(Cog):
             :param original_event: The original SavedScheduleEvent before the edit.
             :return: The saved SavedScheduleEvent.
             """
+            async with self._write_lock:
+                async with self.db.execute(
+                    r"""
+                            UPDATE Scheduler
+                                SET message=$message,
+                                    channel_id=$channel_id,
+                                    mention=$mention,
+                                    repeat=$repeat
+                                WHERE id=$id
+                                RETURNING *
+                        """,
+                    {
+                        "id": original_event.id,
+                        "message": event.message,
+                        "channel_id": event.channel.id,
+                        "mention": event.mention,
+                        "repeat": event.repeat,
+                    },
+                ) as cur:
+                    row = await cur.fetchone()
+                    if row is None:
+                        raise ValueError("Something went wrong with SQLite, row should not be None.")
+                    event_db = SavedScheduleEvent.from_row(row)
 
-            async with self.db.execute(
-                r"""
-                        UPDATE Scheduler
-                            SET message=$message,
-                                channel_id=$channel_id,
-                                mention=$mention,
-                                repeat=$repeat
-                            WHERE id=$id
-                            RETURNING *
-                    """,
-                {
-                    "id": original_event.id,
-                    "message": event.message,
-                    "channel_id": event.channel.id,
-                    "mention": event.mention,
-                    "repeat": event.repeat,
-                },
-            ) as cur:
-                row = await cur.fetchone()
-                if row is None:
-                    raise ValueError("Something went wrong with SQLite, row should not be None.")
-                event_db = SavedScheduleEvent.from_row(row)
-
-            await self.db.commit()
-            return event_db
+                await self.db.commit()
+                return event_db
 
         async def _delete_schedule(
             self, event_id: int, author_id: int, guild_id: int
@@ -1386,78 +1760,34 @@ class Scheduler(Cog):
             :param guild_id: The guild ID of the event.
             :return: The deleted SavedScheduleEvent.
             """
-
-            logger.debug("Deleting event ID %d.", event_id)
-            async with self.db.execute(
-                r"""
-                    UPDATE Scheduler
-                        SET canceled=1
-                        WHERE canceled=0
-                            AND id=$id
-                            AND author_id=$author_id
-                            AND guild_id=$guild_id
-                        RETURNING *
-                """,
-                {
-                    "id": event_id,
-                    "author_id": author_id,
-                    "guild_id": guild_id,
-                },
-            ) as cur:
-                row = await cur.fetchone()
-                if row is None:
-                    return None
-                event_db = SavedScheduleEvent.from_row(row)
-
-            await self.db.commit()
-            logger.info("Deleted event ID %d.", event_id)
-            return event_db
-
-    else:
-
-        async def _insert_schedule(self, event: ScheduleEvent) -> SavedScheduleEvent:
-            """
-            Insert a schedule event into DB SQLite version < 3.35.0.
-
-            When modifying this method, be sure to update the >= 3.35.0 sister method as well.
-
-            :param event: The ScheduleEvent of the event.
-            :return: The saved SavedScheduleEvent.
-            """
-
-            logger.debug("Inserting %s into DB.", event)
-            async with self.db.execute(
-                r"""
-                    INSERT INTO Scheduler (message, guild_id, channel_id,
-                                           author_id, next_event_time, repeat, mention)
-                        VALUES ($message, $guild_id, $channel_id, $author_id,
-                                $next_event_time, $repeat, $mention)
-                """,
-                {
-                    "message": event.message,
-                    "guild_id": event.channel.guild.id,
-                    "channel_id": event.channel.id,
-                    "author_id": event.author.id,
-                    "next_event_time": int(event.time.timestamp()),
-                    "repeat": event.repeat,
-                    "mention": int(event.mention),
-                },
-            ) as cur:
+            async with self._write_lock:
+                logger.debug("Deleting event ID %d.", event_id)
                 async with self.db.execute(
                     r"""
-                    SELECT *
-                        FROM Scheduler
-                        WHERE id=$id
-                        LIMIT 1
-                """,
-                    {"id": cur.lastrowid},
-                ) as cur2:
-                    row = await cur2.fetchone()
+                        UPDATE Scheduler
+                            SET canceled=1
+                            WHERE canceled=0
+                                AND id=$id
+                                AND author_id=$author_id
+                                AND guild_id=$guild_id
+                            RETURNING *
+                    """,
+                    {
+                        "id": event_id,
+                        "author_id": author_id,
+                        "guild_id": guild_id,
+                    },
+                ) as cur:
+                    row = await cur.fetchone()
                     if row is None:
-                        raise ValueError("Something went wrong with SQLite, row should not be None.")
+                        return None
                     event_db = SavedScheduleEvent.from_row(row)
-            await self.db.commit()
-            return event_db
+
+                await self.db.commit()
+                logger.info("Deleted event ID %d.", event_id)
+                return event_db
+
+    else:
 
         async def _edit_schedule(
             self, event: ScheduleEvent, original_event: SavedScheduleEvent
@@ -1471,38 +1801,39 @@ class Scheduler(Cog):
             :param original_event: The original SavedScheduleEvent before the edit.
             :return: The saved SavedScheduleEvent.
             """
-            async with self.db.execute(
-                r"""
-                            UPDATE Scheduler
-                                SET message=$message,
-                                    channel_id=$channel_id,
-                                    mention=$mention,
-                                    repeat=$repeat
-                                WHERE id=$id
-                        """,
-                {
-                    "id": original_event.id,
-                    "message": event.message,
-                    "channel_id": event.channel.id,
-                    "mention": event.mention,
-                    "repeat": event.repeat,
-                },
-            ) as cur:
+            async with self._write_lock:
                 async with self.db.execute(
                     r"""
-                        SELECT *
-                            FROM Scheduler
-                            WHERE id=$id
-                            LIMIT 1
-                    """,
-                    {"id": cur.lastrowid},
-                ) as cur2:
-                    row = await cur2.fetchone()
-                    if row is None:
-                        raise ValueError("Something went wrong with SQLite, row should not be None.")
-                    event_db = SavedScheduleEvent.from_row(row)
-            await self.db.commit()
-            return event_db
+                                UPDATE Scheduler
+                                    SET message=$message,
+                                        channel_id=$channel_id,
+                                        mention=$mention,
+                                        repeat=$repeat
+                                    WHERE id=$id
+                            """,
+                    {
+                        "id": original_event.id,
+                        "message": event.message,
+                        "channel_id": event.channel.id,
+                        "mention": event.mention,
+                        "repeat": event.repeat,
+                    },
+                ) as cur:
+                    async with self.db.execute(
+                        r"""
+                            SELECT *
+                                FROM Scheduler
+                                WHERE id=$id
+                                LIMIT 1
+                        """,
+                        {"id": cur.lastrowid},
+                    ) as cur2:
+                        row = await cur2.fetchone()
+                        if row is None:
+                            raise ValueError("Something went wrong with SQLite, row should not be None.")
+                        event_db = SavedScheduleEvent.from_row(row)
+                await self.db.commit()
+                return event_db
 
         async def _delete_schedule(
             self, event_id: int, author_id: int, guild_id: int
@@ -1517,50 +1848,49 @@ class Scheduler(Cog):
             :param guild_id: The guild ID of the event.
             :return: The deleted SavedScheduleEvent.
             """
+            async with self._write_lock:
+                logger.debug("Deleting event ID %d.", event_id)
 
-            logger.debug("Deleting event ID %d.", event_id)
+                async with self.db.execute(
+                    r"""
+                        SELECT *
+                            FROM Scheduler
+                            WHERE canceled=0
+                                AND id=$id
+                                AND author_id=$author_id
+                                AND guild_id=$guild_id
+                            LIMIT 1
+                    """,
+                    {
+                        "id": event_id,
+                        "author_id": author_id,
+                        "guild_id": guild_id,
+                    },
+                ) as cur:
+                    row = await cur.fetchone()
+                    if row is None:
+                        return None
+                    event_db = SavedScheduleEvent.from_row(row)
 
-            async with self.db.execute(
-                r"""
-                    SELECT *
-                        FROM Scheduler
-                        WHERE canceled=0
-                            AND id=$id
-                            AND author_id=$author_id
-                            AND guild_id=$guild_id
-                        LIMIT 1
-                """,
-                {
-                    "id": event_id,
-                    "author_id": author_id,
-                    "guild_id": guild_id,
-                },
-            ) as cur:
-                row = await cur.fetchone()
-                if row is None:
-                    return None
-                event_db = SavedScheduleEvent.from_row(row)
+                await self.db.execute(
+                    r"""
+                        UPDATE Scheduler
+                            SET canceled=1
+                            WHERE canceled=0
+                                AND id=$id
+                                AND author_id=$author_id
+                                AND guild_id=$guild_id
+                    """,
+                    {
+                        "id": event_id,
+                        "author_id": author_id,
+                        "guild_id": guild_id,
+                    },
+                )
 
-            async with self.db.execute(
-                r"""
-                    UPDATE Scheduler
-                        SET canceled=1
-                        WHERE canceled=0
-                            AND id=$id
-                            AND author_id=$author_id
-                            AND guild_id=$guild_id
-                """,
-                {
-                    "id": event_id,
-                    "author_id": author_id,
-                    "guild_id": guild_id,
-                },
-            ):
-                pass
-
-            await self.db.commit()
-            logger.info("Deleted event ID %d.", event_id)
-            return event_db
+                await self.db.commit()
+                logger.info("Deleted event ID %d.", event_id)
+                return event_db
 
     @staticmethod
     def _make_info_embed(event: SavedScheduleEvent) -> discord.Embed:
@@ -1586,7 +1916,7 @@ class Scheduler(Cog):
                 repeat_message = f"Every {repeat:.2f} minute{'s' if repeat != 1 else ''}"
             embed.add_field(name="Repeat", value=repeat_message, inline=True)
 
-        mentions = re.search(r"@(everyone|here|[!&]?[0-9]{17,20})", event.message)
+        mentions = _MENTION_RE.search(event.message)
         if mentions is not None:  # has mentions
             embed.add_field(name="Ping Enabled", value="Yes" if event.mention else "No", inline=True)
         timestamp = int(event.next_event_time)
@@ -1696,8 +2026,8 @@ class Scheduler(Cog):
 
             logger.info("Edited schedule in database with ID %d.", original_event.id)
             logger.info(
-                "Message (preview): %s\nGuild: %s\nChannel: %s\nAuthor: %s\nRepeat: %s\nMention: %s\nTime: %s",
-                event.message[:80],
+                "Message (preview): %.80s\nGuild: %s\nChannel: %s\nAuthor: %s\nRepeat: %s\nMention: %s\nTime: %s",
+                event.message,
                 event.channel.guild,
                 event.channel,
                 event.author,
@@ -1735,8 +2065,8 @@ class Scheduler(Cog):
 
         logger.info("Added schedule into database with ID %d.", event_db.id)
         logger.info(
-            "Message (preview): %s\nGuild: %s\nChannel: %s\nAuthor: %s\nRepeat: %s\nMention: %s\nTime: %s",
-            event.message[:80],
+            "Message (preview): %.80s\nGuild: %s\nChannel: %s\nAuthor: %s\nRepeat: %s\nMention: %s\nTime: %s",
+            event.message,
             event.channel.guild,
             event.channel,
             event.author,
@@ -1746,27 +2076,24 @@ class Scheduler(Cog):
         )
 
         # Add the event into the schedule heap
-        async with self.heap_lock:
-            heapq.heappush(self.schedule_heap, event_db.strip())
+        stripped_event = event_db.strip()
+        self._heap_events[stripped_event.id] = stripped_event
+        heapq.heappush(self.schedule_heap, stripped_event.heap_entry())
+        self._wakeup.set()  # the new event may be due before the scheduler loop's deadline
         return event_db
 
-    async def send_scheduled_message(self, stripped_event: StrippedSavedScheduleEvent) -> bool:
+    async def send_scheduled_message(
+        self, stripped_event: StrippedSavedScheduleEvent, cache: SendTargetCache | None = None
+    ) -> bool:
         """
         Sends a scheduled event message.
 
         :param stripped_event: The stripped event stored within the cache.
+        :param cache: Resolved channels, authors and permissions that passed the checks, shared within a batch.
         :return: True if send was successful, False otherwise.
         """
 
-        # Check if the event was canceled
-        async with self.db.execute(
-            r"""
-            SELECT *
-                FROM Scheduler
-                WHERE id=$id
-        """,
-            {"id": stripped_event.id},
-        ) as cur:
+        async with self.db.execute(_SQL_SELECT_EVENT, {"id": stripped_event.id}) as cur:
             row = await cur.fetchone()
             if row is None:
                 logger.error("Row should not be None, why was this deleted?")
@@ -1775,139 +2102,170 @@ class Scheduler(Cog):
         event = SavedScheduleEvent.from_row(row)
         stripped_event.repeat = event.repeat  # sync the stripped repeat status
 
-        if event.canceled:  # if canceled is true
+        if event.canceled:  # canceled outside of this process
             logger.warning("Event with ID %d was canceled.", event.id)
             return False
 
-        # Check if bot is still in guild
-        guild = self.bot.get_guild(event.guild_id)
-        if not guild:
-            logger.warning("Event with ID %d guild not found.", event.id)
-            return False
+        target_key = (event.guild_id, event.channel_id, event.author_id)
+        if cache is not None and target_key in cache:
+            channel, author, perms_author, perms_bot = cache[target_key]
+        else:
+            # Check if bot is still in guild
+            guild = self.bot.get_guild(event.guild_id)
+            if not guild:
+                logger.warning("Event with ID %d guild not found.", event.id)
+                return False
 
-        # Check if channel still exists
-        channel = guild.get_channel_or_thread(event.channel_id)
-        if not channel:
-            logger.warning("Event with ID %d channel not found.", event.id)
-            return False
-        if not hasattr(channel, "send"):
-            logger.warning("Event with ID %d channel is not a messageable channel.", event.id)
-            return False
+            # Check if channel still exists
+            channel = guild.get_channel_or_thread(event.channel_id)
+            if not channel:
+                logger.warning("Event with ID %d channel not found.", event.id)
+                return False
+            if not isinstance(channel, discord.abc.Messageable):
+                logger.warning("Event with ID %d channel is not a messageable channel.", event.id)
+                return False
 
-        # Check if user is still in guild
-        author = guild.get_member(event.author_id)
-        if not author:
-            try:
-                author = await guild.fetch_member(event.author_id)
-            except discord.NotFound:
-                logger.warning("Event with ID %d author not found.", event.id)
+            # Check if user is still in guild
+            author = guild.get_member(event.author_id)
+            if not author:
+                if guild.chunked:
+                    # The member cache is complete, so the author really left; don't block the loop on the API
+                    logger.warning("Event with ID %d author not found.", event.id)
+                    return False
+                try:
+                    author = await guild.fetch_member(event.author_id)
+                except discord.NotFound:
+                    logger.warning("Event with ID %d author not found.", event.id)
+                    return False
+
+            # Check if the still user has permission
+            perms_author = channel.permissions_for(author)
+            if not perms_author.read_messages or not perms_author.send_messages:
+                logger.warning("Event with ID %d author doesn't have perms.", event.id)
                 return False
 
-        # Check if the still user has permission
-        perms_author = channel.permissions_for(author)
-        if not perms_author.read_messages or not perms_author.send_messages:
-            logger.warning("Event with ID %d author doesn't have perms.", event.id)
-            return False
+            # Check if the bot still has permission
+            perms_bot = channel.permissions_for(guild.me)
+            if not perms_bot.read_messages or not perms_bot.send_messages:
+                logger.warning("Event with ID %d bot doesn't have perms.", event.id)
+                return False
 
-        # Check if the bot still has permission
-        perms_bot = channel.permissions_for(guild.me)
-        if not perms_bot.read_messages or not perms_bot.send_messages:
-            logger.warning("Event with ID %d bot doesn't have perms.", event.id)
-            return False
+            if cache is not None:
+                cache[target_key] = channel, author, perms_author, perms_bot
 
         if event.mention and perms_author.mention_everyone:  # if mentions is enabled and author still has perms
-            allowed_mentions = discord.AllowedMentions.all()
+            allowed_mentions = _MENTIONS_ALL
         else:
             if event.mention:
                 logger.debug(
                     "Event with ID %s mention disabled due to author doesn't have mention_everyone permission.",
                     event.id,
                 )
-            allowed_mentions = discord.AllowedMentions.none()
-        # channel has .send since invalid channel typed are filtered above with hasattr(channel, 'send')
-        await channel.send(  # type: ignore[reportGeneralTypeIssues]
-            event.message, allowed_mentions=allowed_mentions
-        )
+            allowed_mentions = _MENTIONS_NONE
+        await channel.send(event.message, allowed_mentions=allowed_mentions)
         # TODO: add a "report abuse" feature/command, save all sent msg in a db table with the id
         return True
 
     async def _scheduler_event_loop(self) -> None:
         """
-        Internal iteration of the scheduler event loop.
+        Internal iteration of the scheduler event loop, fires all events that are due.
         """
-        should_sleep = False
-        while not should_sleep:
-            should_sleep = True
+        now = _time.time()
+        due_events: list[StrippedSavedScheduleEvent] = []
+        # Peek the next event, only pop it from the heap once it's due
+        while self.schedule_heap and self.schedule_heap[0][0] <= now:
+            _, _, next_event = heapq.heappop(self.schedule_heap)
+            if next_event.canceled:
+                self._canceled_count -= 1
+                continue  # already canceled in the database by the delete command
+            del self._heap_events[next_event.id]
+            due_events += [next_event]
 
-            if self.schedule_heap:
-                async with self.heap_lock:  # pop the next event from heap
-                    next_event = heapq.heappop(self.schedule_heap)
+        if not due_events:
+            return
+        logger.debug("Firing %d due events.", len(due_events))
 
-                now = arrow.utcnow().timestamp()
-                # Time has past
-                if next_event.next_event_time < now:
-                    should_sleep = False
-                    try:
-                        # Attempt to send the message
-                        success = await self.send_scheduled_message(next_event)
-                    except Exception as e:
-                        # Something unexpected went wrong
-                        logger.error(
-                            "Something went wrong while sending the scheduled message with event ID %d.",
-                            next_event.id,
-                            exc_info=e,
-                        )
-                        success = False
+        canceled_events: list[StrippedSavedScheduleEvent] = []
+        repeated_events: list[StrippedSavedScheduleEvent] = []
+        send_cache: SendTargetCache = {}  # only lives for this batch, so permission changes are picked up
+        try:
+            for next_event in due_events:
+                try:
+                    # Attempt to send the message
+                    success = await self.send_scheduled_message(next_event, send_cache)
+                except Exception as e:
+                    # Something unexpected went wrong
+                    logger.error(
+                        "Something went wrong while sending the scheduled message with event ID %d.",
+                        next_event.id,
+                        exc_info=e,
+                    )
+                    success = False
+
+                # The repeat time is updated within send_scheduled_message() in case of edits
+                if not success or next_event.repeat is None:
+                    # If the message failed to send or the message isn't on repeat, then cancel the schedule
+                    canceled_events += [next_event]
+                    if not success:
+                        logger.info("Canceled %s because it failed.", next_event)
+                else:
+                    # Otherwise, update the next_event_time
+                    repeated_events += [next_event.do_repeat(int(now))]
+        finally:
+            # re-add the updated events
+            for new_event in repeated_events:
+                self._heap_events[new_event.id] = new_event
+                heapq.heappush(self.schedule_heap, new_event.heap_entry())
+
+            # Write all the changes in a single transaction, also when cog_unload cancels the loop mid-batch,
+            # so messages that were already sent aren't sent again after a restart
+            async with self._write_lock:
+                if canceled_events:
+                    await self.db.executemany(
+                        _SQL_CANCEL,
+                        [{"id": canceled_event.id} for canceled_event in canceled_events],
+                    )
+                if repeated_events:
+                    await self.db.executemany(
+                        _SQL_RESCHEDULE,
+                        [
+                            {"next_event_time": new_event.next_event_time, "id": new_event.id}
+                            for new_event in repeated_events
+                        ],
+                    )
+                await self.db.commit()
 
-                    # The repeat time is updated within send_scheduled_message() in case of edits
-                    if not success or next_event.repeat is None:
-                        # If the message failed to send or the message isn't on repeat, then cancel the schedule
-                        async with self.db.execute(
-                            r"""
-                                UPDATE Scheduler
-                                    SET canceled=1
-                                    WHERE id=$id
-                            """,
-                            {"id": next_event.id},
-                        ):
-                            pass
-                        await self.db.commit()
-                        if not success:
-                            logger.info("Canceled %s because it failed.", next_event)
+    async def _wait_for_next_event(self) -> None:
+        """
+        Sleep until the next event in the heap is due, or until woken up by a new event.
+        """
+        if self.schedule_heap:
+            delay = min(self.schedule_heap[0][0] - _time.time(), self.MAX_SLEEP)
+        else:
+            delay = self.MAX_SLEEP
 
-                    else:
-                        # Otherwise, update the next_event_time
-                        new_event = next_event.do_repeat(int(now))
-                        async with self.db.execute(
-                            r"""
-                                UPDATE Scheduler
-                                    SET next_event_time=$next_event_time
-                                    WHERE id=$id
-                            """,
-                            {"next_event_time": new_event.next_event_time, "id": next_event.id},
-                        ):
-                            pass
-                        await self.db.commit()
-                        # re-add the updated event
-                        async with self.heap_lock:
-                            heapq.heappush(self.schedule_heap, new_event)
-                else:
-                    # re-add the original event when the time isn't up yet
-                    async with self.heap_lock:
-                        heapq.heappush(self.schedule_heap, next_event)
+        if delay <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
 
     async def scheduler_event_loop(self) -> None:
         """
-        The main scheduler event loop, checks every second.
+        The main scheduler event loop, sleeps until the next event is due.
         """
         await self.bot.wait_until_ready()
 
         while not self.bot.is_closed():
+            # Clear before processing, so events added while processing still wake up the wait below
+            self._wakeup.clear()
             try:
                 await self._scheduler_event_loop()
             except Exception as e:
                 logger.error("An uncaught error was raised during scheduled event loop.", exc_info=e)
-            await asyncio.sleep(1)
+                await asyncio.sleep(1)  # don't spin if the error keeps happening
+            await self._wait_for_next_event()
 
     async def _schedule_create(self, ctx: commands.Context[Bot], channel: MessageableGuildChannel | None) -> None:
         """
@@ -2168,6 +2526,8 @@ class Scheduler(Cog):
             raise ValueError("Shouldn't be None here.")
 
         removed_event = await self._delete_schedule(event_id, ctx.author.id, ctx.guild.id)
+        if removed_event is not None:
+            await self._cancel_heap_event(removed_event.id)
         if removed_event is None:
             embed = discord.Embed(
                 description=f"You **do not** have a scheduled message with Event ID #{event_id}.", colour=COLOUR
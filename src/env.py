@@ -20,6 +20,7 @@ __all__ = [
     "PREFIX",
     "COLOUR",
     "SCHEDULER_DATABASE_PATH",
+    "SCHEDULER_DATABASE_WAL",
     "PYPROJECT_TOML_PATH",
     "DEBUG_GUILDS",
     "SYNC_SLASH_COMMANDS",
@@ -53,6 +54,9 @@ SCHEDULER_DATABASE_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", SCHEDULER_DATABASE_NAME
 )
 
+# Use write-ahead logging for the database, turn off if the database is shared with other processes
+SCHEDULER_DATABASE_WAL = strtobool(os.getenv("SCHEDULER_DATABASE_WAL", "on"))
+
 PYPROJECT_TOML_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pyproject.toml")
 
 # Configure debug servers